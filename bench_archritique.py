@@ -0,0 +1,214 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from archritique import ArchCritique
+
+SIZES = (100, 1000, 10000, 100000, 1000000)
+STAGES = ('analyze_input_text', 'generate_critique_score', 'generate_detailed_critique')
+
+FILLER = [
+    'the', 'design', 'building', 'proposal', 'project', 'space', 'spaces', 'level', 'levels', 'with',
+    'and', 'of', 'to', 'a', 'in', 'for', 'through', 'along', 'between', 'which', 'its', 'new', 'existing',
+    'ground', 'floor', 'roof', 'street', 'courtyard', 'public', 'private', 'residents', 'visitors',
+    'north', 'south', 'east', 'west', 'wing', 'core', 'envelope', 'structure', 'frame', 'grid',
+    'timber', 'brick', 'landscape', 'entrance', 'lobby', 'studio', 'housing', 'school', 'library'
+]
+
+
+def generate_document(critic: ArchCritique, words: int, density: float = 0.08, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    vocabulary = []
+    for principle_name in critic.principles:
+        vocabulary.extend(critic.principles[principle_name]['keywords'])
+    for style_name in critic.styles:
+        vocabulary.extend(critic.styles[style_name])
+    for category in critic.jargon:
+        vocabulary.extend(critic.jargon[category])
+    vocabulary.extend(critic.tech_terms)
+    vocabulary.extend(critic.conceptual_indicators)
+
+    sentences = []
+    sentence: List[str] = []
+    produced = 0
+    target = rng.randint(8, 24)
+    while produced < words:
+        if rng.random() < density:
+            term = rng.choice(vocabulary)
+        else:
+            term = rng.choice(FILLER)
+        sentence.append(term)
+        produced = produced + len(term.split())
+        if len(sentence) >= target:
+            sentences.append(' '.join(sentence).capitalize() + rng.choice(['.', '.', '.', '!', '?']))
+            sentence = []
+            target = rng.randint(8, 24)
+        if len(sentences) % 6 == 5 and not sentence:
+            sentences.append('\n\n')
+    if sentence:
+        sentences.append(' '.join(sentence).capitalize() + '.')
+    return ' '.join(sentences)
+
+
+def _time_per_document(func, documents: List[str], repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for document in documents:
+            func(document)
+        elapsed = (time.perf_counter() - started) / len(documents)
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench_score(critic: ArchCritique, documents: List[str], repeat: int = 3) -> None:
+    for document in documents:
+        if critic.score(document) != critic.evaluate(document).score:
+            raise SystemExit("score() diverged from the full critique path")
+
+    full = _time_per_document(critic.critique, documents, repeat)
+    evaluated = _time_per_document(lambda document: critic.evaluate(document).score, documents, repeat)
+    fast = _time_per_document(critic.score, documents, repeat)
+
+    print(f"{'PATH':<28}{'MS/DOC':>10}{'SPEEDUP':>10}")
+    for label, seconds in (('critique()', full), ('evaluate().score', evaluated), ('score()', fast)):
+        print(f"{label:<28}{seconds * 1000:>10.3f}{full / seconds:>9.1f}x")
+
+
+def _docs_for(words: int, budget: int) -> int:
+    return max(1, min(50, budget // words))
+
+
+def bench_stages(critic: ArchCritique, words: int, docs: int, density: float = 0.08,
+                 repeat: int = 3) -> Dict[str, Any]:
+    documents = [generate_document(critic, words, density, seed=seed) for seed in range(docs)]
+    size = sum(len(document.encode('utf-8')) for document in documents)
+
+    best = {stage: None for stage in STAGES}
+    for _ in range(repeat):
+        elapsed = dict.fromkeys(STAGES, 0.0)
+        for document in documents:
+            started = time.perf_counter()
+            analysis = critic.analyze_input_text(document)
+            analyzed = time.perf_counter()
+            score = critic.generate_critique_score(analysis)
+            scored = time.perf_counter()
+            critic.generate_detailed_critique(document, analysis, score, seed=0)
+            finished = time.perf_counter()
+            elapsed['analyze_input_text'] += analyzed - started
+            elapsed['generate_critique_score'] += scored - analyzed
+            elapsed['generate_detailed_critique'] += finished - scored
+        for stage in STAGES:
+            if best[stage] is None or elapsed[stage] < best[stage]:
+                best[stage] = elapsed[stage]
+
+    tracemalloc.start()
+    for document in documents[:1]:
+        analysis = critic.analyze_input_text(document)
+        critic.generate_detailed_critique(document, analysis, critic.generate_critique_score(analysis), seed=0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    total = sum(best.values())
+    return {
+        'words': words,
+        'docs': docs,
+        'bytes': size,
+        'stages_ms': {stage: best[stage] / docs * 1000 for stage in STAGES},
+        'total_ms': total / docs * 1000,
+        'docs_per_s': docs / total,
+        'mb_per_s': size / total / 1e6,
+        'peak_mb': peak / 1e6
+    }
+
+
+def print_stages(results: List[Dict[str, Any]]) -> None:
+    print(f"{'WORDS':>9}{'DOCS':>6}{'ANALYZE MS':>12}{'SCORE MS':>10}{'REPORT MS':>11}"
+          f"{'DOCS/S':>10}{'MB/S':>8}{'PEAK MB':>9}")
+    for result in results:
+        stages = result['stages_ms']
+        print(f"{result['words']:>9}{result['docs']:>6}{stages['analyze_input_text']:>12.3f}"
+              f"{stages['generate_critique_score']:>10.4f}{stages['generate_detailed_critique']:>11.3f}"
+              f"{result['docs_per_s']:>10.1f}{result['mb_per_s']:>8.2f}{result['peak_mb']:>9.2f}")
+
+
+def compare_baseline(results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Stages slower than the baseline by more than ``threshold`` (0.2 = 20%)."""
+    previous = {entry['words']: entry for entry in baseline['results']}
+    regressions = []
+    for result in results:
+        before = previous.get(result['words'])
+        if before is None:
+            continue
+        for stage in STAGES:
+            old = before['stages_ms'][stage]
+            new = result['stages_ms'][stage]
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append(f"{stage} @ {result['words']} WORDS: {old:.3f} -> {new:.3f} MS "
+                                   f"(+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def run_suite(args: argparse.Namespace) -> int:
+    critic = ArchCritique()
+    results = []
+    for words in args.sizes:
+        docs = args.docs if args.docs else _docs_for(words, args.word_budget)
+        results.append(bench_stages(critic, words, docs, args.density, args.repeat))
+    print_stages(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as handle:
+            json.dump({'python': platform.python_version(), 'lexicon': critic.lexicon_fingerprint(),
+                       'density': args.density, 'results': results}, handle, indent=2)
+        print(f"BASELINE SAVED TO {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        if baseline.get('lexicon') != critic.lexicon_fingerprint():
+            print("WARNING: BASELINE WAS RECORDED WITH A DIFFERENT LEXICON", file=sys.stderr)
+        regressions = compare_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"REGRESSIONS BEYOND {args.threshold * 100:.0f}%:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"NO REGRESSIONS BEYOND {args.threshold * 100:.0f}%")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the critique pipeline on a synthetic corpus")
+    parser.add_argument('suite', nargs='?', choices=('stages', 'score'), default='stages',
+                        help="per-stage timings across document sizes, or the score() fast path")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help="document sizes in words")
+    parser.add_argument('--docs', type=int, default=None,
+                        help="documents per size (default: fill --word-budget, at most 50)")
+    parser.add_argument('--word-budget', type=int, default=200000)
+    parser.add_argument('--words', type=int, default=1500, help="document size for the score suite")
+    parser.add_argument('--density', type=float, default=0.08, help="share of words drawn from the lexicon")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', help="JSON baseline to compare against")
+    parser.add_argument('--save-baseline', help="write this run's results as a baseline")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed slowdown before failing")
+    args = parser.parse_args(argv)
+
+    if args.suite == 'score':
+        critic = ArchCritique()
+        docs = args.docs or 50
+        documents = [generate_document(critic, args.words, args.density, seed=seed) for seed in range(docs)]
+        print(f"{docs} DOCUMENTS x {args.words} WORDS")
+        bench_score(critic, documents, args.repeat)
+        return
+    sys.exit(run_suite(args))
+
+
+if __name__ == "__main__":
+    main()
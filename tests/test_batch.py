@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from archritique import SAMPLE_TEXT, ArchCritique, iter_batch_records, run_batch
+
+
+def _write_records(path, count, broken_at=None):
+    with open(path, 'w', encoding='utf-8') as handle:
+        for index in range(count):
+            if index == broken_at:
+                handle.write(json.dumps({'id': f'r{index}'}) + '\n')
+            else:
+                text = f"{SAMPLE_TEXT} Record {index} adds {'green ' * (index % 5)}roofs."
+                handle.write(json.dumps({'id': f'r{index}', 'text': text}) + '\n')
+
+
+def test_records_from_files_directories_and_jsonl(tmp_path):
+    (tmp_path / 'docs' / 'sub').mkdir(parents=True)
+    (tmp_path / 'docs' / 'b.txt').write_text('second', encoding='utf-8')
+    (tmp_path / 'docs' / 'sub' / 'a.md').write_text('third', encoding='utf-8')
+    (tmp_path / 'docs' / 'skip.bin').write_text('ignored', encoding='utf-8')
+    _write_records(tmp_path / 'in.jsonl', 2)
+    records = list(iter_batch_records([str(tmp_path / 'in.jsonl'), str(tmp_path / 'docs')]))
+    assert [record['id'] for record in records][:2] == ['r0', 'r1']
+    assert [record['text'] for record in records][2:] == ['second', 'third']
+    assert [record['id'] for record in iter_batch_records([str(tmp_path / 'in.jsonl')], skip=1)] == ['r1']
+
+
+@pytest.mark.parametrize('format', ['jsonl', 'csv'])
+def test_interrupted_run_resumes_from_checkpoint(tmp_path, format):
+    critic = ArchCritique()
+    source = str(tmp_path / 'in.jsonl')
+    clean = str(tmp_path / f'clean.{format}')
+    _write_records(source, 45)
+    run_batch(critic, [source], clean, format, jobs=1)
+
+    output = str(tmp_path / f'out.{format}')
+    checkpoint = str(tmp_path / 'checkpoint.json')
+    _write_records(source, 45, broken_at=32)
+    with pytest.raises(ValueError):
+        run_batch(critic, [source], output, format, jobs=1, checkpoint=checkpoint, checkpoint_every=10)
+    with open(checkpoint, encoding='utf-8') as handle:
+        assert json.load(handle)['completed'] == 32
+
+    _write_records(source, 45)
+    assert run_batch(critic, [source], output, format, jobs=2, chunksize=4, checkpoint=checkpoint) == 13
+    with open(output, 'rb') as resumed, open(clean, 'rb') as expected:
+        assert resumed.read() == expected.read()
+    assert not (tmp_path / 'checkpoint.json').exists()
+
+
+def test_checkpoint_for_another_run_is_refused(tmp_path):
+    source = str(tmp_path / 'in.jsonl')
+    _write_records(source, 3)
+    checkpoint = tmp_path / 'checkpoint.json'
+    checkpoint.write_text(json.dumps({'inputs': ['other'], 'format': 'jsonl', 'mode': 'analysis',
+                                      'lexicon': 'x', 'completed': 1, 'offset': 10}), encoding='utf-8')
+    with pytest.raises(ValueError):
+        run_batch(ArchCritique(), [source], str(tmp_path / 'out.jsonl'), checkpoint=str(checkpoint))
@@ -0,0 +1,27 @@
+from archritique import SAMPLE_TEXT, AnalysisStore, ArchCritique, CritiqueCache
+
+
+def test_repeated_score_hits_the_cache():
+    cache = CritiqueCache()
+    critic = ArchCritique(cache=cache)
+    scores = [critic.score(SAMPLE_TEXT) for _ in range(5)]
+    assert scores == [ArchCritique().score(SAMPLE_TEXT)] * 5
+    assert (cache.misses, cache.hits, len(cache)) == (1, 4, 1)
+
+
+def test_score_and_critique_share_cache_entries():
+    cache = CritiqueCache()
+    critic = ArchCritique(cache=cache)
+    score = critic.score(SAMPLE_TEXT)
+    assert critic.evaluate(SAMPLE_TEXT).score == score
+    assert cache.hits == 1
+
+
+def test_score_persists_to_store(tmp_path):
+    path = str(tmp_path / 'analyses.sqlite')
+    critic = ArchCritique(store=AnalysisStore(path))
+    score = critic.score(SAMPLE_TEXT)
+    critic.flush()
+    reopened = AnalysisStore(path)
+    stored = reopened.get(ArchCritique().cache_key(SAMPLE_TEXT))
+    assert stored is not None and stored[1] == score
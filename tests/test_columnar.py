@@ -0,0 +1,44 @@
+import pytest
+
+from archritique import SAMPLE_TEXT, ArchCritique, ColumnarWriter, load_columns
+
+np = pytest.importorskip('numpy')
+
+
+def _documents(count, fail_at=None):
+    for index in range(count):
+        if index == fail_at:
+            raise RuntimeError("source failed")
+        yield f"{SAMPLE_TEXT} Variation number {index} with solar panels."
+
+
+def test_export_round_trip(tmp_path):
+    critic = ArchCritique()
+    texts = list(_documents(25))
+    path = str(tmp_path / 'export')
+    writer = critic.export_columns(path, texts, row_group_size=10)
+    assert writer.rows == 25
+    columns, meta = load_columns(path)
+    assert meta['rows'] == 25
+    assert meta['row_groups'] == 3
+    assert list(columns['score']) == [critic.score(text) for text in texts]
+
+
+def test_failed_export_is_incomplete(tmp_path):
+    critic = ArchCritique()
+    path = str(tmp_path / 'export')
+    with pytest.raises(RuntimeError):
+        critic.export_columns(path, _documents(25, fail_at=10), row_group_size=4)
+    with pytest.raises(ValueError):
+        load_columns(path)
+
+
+def test_failed_export_over_previous_one_is_incomplete(tmp_path):
+    critic = ArchCritique()
+    path = str(tmp_path / 'export')
+    critic.export_columns(path, _documents(5))
+    with pytest.raises(RuntimeError):
+        with ColumnarWriter(path, critic.lexicon) as writer:
+            writer.write_many(critic._analyze_and_score(text) for text in _documents(5, fail_at=3))
+    with pytest.raises(ValueError):
+        load_columns(path)
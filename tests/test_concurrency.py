@@ -0,0 +1,46 @@
+import asyncio
+import re
+
+from archritique import SAMPLE_TEXT, AnalysisStore, ArchCritique
+
+
+def _texts(count):
+    return [f"{SAMPLE_TEXT} Variation {index} with {'solar ' * (index % 4)}panels." for index in range(count)]
+
+
+def _strip_timestamp(report):
+    return re.sub(r'GENERATED: [0-9: -]+', 'GENERATED:', report)
+
+
+def test_critique_many_matches_serial_reports():
+    critic = ArchCritique(seed=3)
+    texts = _texts(12)
+    expected = [_strip_timestamp(critic.critique(text)) for text in texts]
+    assert [_strip_timestamp(report) for report in critic.critique_many(texts, workers=2, chunksize=3)] == expected
+    unordered = dict(critic.critique_many(texts, workers=2, chunksize=5, ordered=False, max_in_flight=1))
+    assert [_strip_timestamp(unordered[index]) for index in range(len(texts))] == expected
+
+
+def test_score_many_matches_score():
+    critic = ArchCritique()
+    texts = _texts(10)
+    assert list(critic.score_many(texts, workers=2, chunksize=3)) == [critic.score(text) for text in texts]
+
+
+def test_acritique_many_matches_serial_reports():
+    critic = ArchCritique()
+    texts = _texts(6)
+    expected = [_strip_timestamp(critic.critique(text)) for text in texts]
+    reports = asyncio.run(critic.acritique_many(texts))
+    assert [_strip_timestamp(report) for report in reports] == expected
+
+
+def test_store_is_shared_with_worker_processes(tmp_path):
+    path = str(tmp_path / 'analyses.sqlite')
+    texts = _texts(8)
+    critic = ArchCritique(store=AnalysisStore(path))
+    scores = list(critic.score_many(texts, workers=2, chunksize=2))
+    reader = AnalysisStore(path)
+    for text, score in zip(texts, scores):
+        stored = reader.get(critic.cache_key(text))
+        assert stored is not None and stored[1] == score
@@ -0,0 +1,164 @@
+import random
+import re
+
+import pytest
+
+from archritique import ArchCritique, CorpusIndex, MicroBatcher, _ordinal
+
+
+def _analysis(score, style='modernist'):
+    return {'detected_style': style, 'principle_scores': {'sustainability': {'score': score}}}
+
+
+def test_add_many_keeps_last_row_for_repeated_key():
+    index = CorpusIndex()
+    index.add_many([('k', _analysis(10), 10), ('k', _analysis(20), 20)])
+    assert index.range() == [('k', 20.0)]
+    assert index.count() == 1
+    assert index.percentile_rank(15) == 0.0
+
+
+def test_add_many_replaces_existing_key():
+    index = CorpusIndex()
+    index.add('k', _analysis(10), 10)
+    index.add_many([('k', _analysis(30), 30), ('j', _analysis(5), 5), ('k', _analysis(20), 20)])
+    assert index.range() == [('k', 20.0), ('j', 5.0)]
+    assert index.count(style='modernist') == 2
+    assert index.range(principle='sustainability') == [('k', 20.0), ('j', 5.0)]
+
+
+def test_index_matches_brute_force():
+    rng = random.Random(7)
+    index = CorpusIndex()
+    rows = {}
+    for step in range(600):
+        key = f'doc{rng.randrange(150)}'
+        score = round(rng.uniform(0, 100), 1)
+        style = rng.choice(['modernist', 'brutalist', None])
+        if step % 3 == 0:
+            index.add_many([(key, _analysis(score, style), score)])
+        else:
+            index.add(key, _analysis(score, style), score)
+        rows[key] = (score, style)
+    scores = sorted(score for score, _ in rows.values())
+    assert index.count() == len(rows)
+    assert [score for _, score in index.top(10)] == scores[::-1][:10]
+    assert index.count_range(20, 60) == sum(1 for score in scores if 20 <= score <= 60)
+    below = sum(1 for score in scores if score < 50) + sum(1 for score in scores if score == 50) / 2
+    assert index.percentile_rank(50) == pytest.approx(below * 100 / len(scores))
+
+
+@pytest.mark.parametrize('value, expected', [
+    (1, '1ST'), (2, '2ND'), (3, '3RD'), (4, '4TH'), (11, '11TH'), (12, '12TH'), (13, '13TH'),
+    (21.6, '22ND'), (101, '101ST'), (111, '111TH'), (0, '0TH'), (100, '100TH'),
+])
+def test_ordinal(value, expected):
+    assert _ordinal(value) == expected
+
+
+def test_comparative_section_uses_ordinals():
+    critic = ArchCritique(corpus_index=CorpusIndex())
+    for seed in range(5):
+        critic.evaluate(f'Brutalist raw concrete monumental design number {seed} with sustainable green roof.')
+    report = critic.critique('Brutalist raw concrete monumental design with sustainable green roof.')
+    ranks = re.findall(r'(\d+)(ST|ND|RD|TH) PERCENTILE', report)
+    assert ranks
+    for number, suffix in ranks:
+        assert _ordinal(int(number)) == number + suffix
+
+
+def test_comparison_leaves_out_the_document_itself():
+    critic = ArchCritique(corpus_index=CorpusIndex())
+    text = 'Brutalist raw concrete monumental design with sustainable green roof.'
+    first = critic.evaluate(text)
+    assert 'HISTORICAL DATABASE' in first.comparative_analysis
+    critic.evaluate('Minimal glass pavilion with light and open plan.')
+    again = critic.evaluate(text)
+    section = again.comparative_analysis
+    assert 'OF THE 1 OTHER SUBMISSION IN OUR DATABASE' in section
+    assert 'SUBMISSIONS' not in section
+
+
+def test_standing_excludes_key():
+    index = CorpusIndex()
+    index.add('a', _analysis(10), 10)
+    index.add('b', _analysis(30), 30)
+    assert index.standing(_analysis(30), 30, exclude='b') == {
+        'count': 1, 'percentile': 100.0, 'style': 'modernist', 'style_count': 1,
+        'style_percentile': 100.0, 'principles': {'sustainability': 100.0}}
+    assert index.standing(_analysis(10), 10, exclude='a')['percentile'] == 0.0
+    assert index.standing(_analysis(20), 20)['count'] == 2
+    single = CorpusIndex()
+    single.add('a', _analysis(10), 10)
+    assert single.standing(_analysis(10), 10, exclude='a') is None
+
+
+def _documents(count):
+    styles = ['Brutalist raw concrete', 'Minimal glass pavilion', 'Parametric curved shell']
+    return [f'{styles[number % 3]} design number {number} with sustainable green roof and daylight.'
+            for number in range(count)]
+
+
+def _undated(report):
+    return re.sub(r'GENERATED: [^\n]*', '', report)
+
+
+def test_pooled_critiques_fill_the_callers_index():
+    texts = _documents(9)
+    serial = ArchCritique(corpus_index=CorpusIndex())
+    expected = [_undated(report) for report in serial.critique_many(texts, workers=1)]
+    critic = ArchCritique(corpus_index=CorpusIndex())
+    assert [_undated(report) for report in critic.critique_many(texts, workers=2, chunksize=2)] == expected
+    assert len(critic.corpus_index) == len(texts)
+    assert critic.corpus_index.top(3) == serial.corpus_index.top(3)
+
+
+def test_batcher_ranks_in_the_callers_index():
+    critic = ArchCritique(corpus_index=CorpusIndex())
+    batcher = MicroBatcher(critic, workers=1, max_delay=0.001)
+    try:
+        for text in _documents(4):
+            response = batcher.submit({'text': text, 'mode': 'report'}).result(timeout=30)
+        score = batcher.submit({'text': 'Glass box.', 'mode': 'score'}).result(timeout=30)
+    finally:
+        batcher.close()
+    assert len(critic.corpus_index) == 4
+    assert 'OF THE 3 OTHER SUBMISSIONS' in response['report']
+    assert score == {'score': critic.score('Glass box.')}
+
+
+def test_ties_and_discards_keep_columns_consistent():
+    rng = random.Random(3)
+    index = CorpusIndex()
+    live = {}
+    for step in range(6000):
+        key = f'doc{rng.randrange(900)}'
+        if rng.random() < 0.3:
+            index.discard(key)
+            live.pop(key, None)
+        else:
+            score = rng.choice([0.0, 0.0, 0.0, 50.0, rng.uniform(0, 100)])
+            index.add(key, _analysis(score), score)
+            live[key] = score
+    assert len(index._keys) - len(index) <= max(1024, len(index))
+    expected = sorted(((score, key) for key, score in live.items()), key=lambda row: -row[0])
+    assert sorted(index.range()) == sorted((key, score) for key, score in live.items())
+    assert [score for _, score in index.range()] == [score for score, _ in expected]
+    for column in index._columns.values():
+        assert list(zip(column.values, column.ids)) == sorted(zip(column.values, column.ids))
+        assert column.pending == sorted(column.pending)
+    assert index.count(principle='sustainability') == len(live)
+
+
+def test_comparative_section_is_fixed_at_evaluation():
+    critic = ArchCritique(corpus_index=CorpusIndex())
+    for text in _documents(3):
+        critic.evaluate(text)
+    result = critic.evaluate('Brutalist raw concrete monumental design with sustainable green roof.')
+    for text in _documents(12)[3:]:
+        critic.evaluate(text)
+    section = result.comparative_analysis
+    assert 'OF THE 3 OTHER SUBMISSIONS' in section
+    assert result.standing['count'] == 3
+    result._sections.clear()
+    assert result.comparative_analysis == section
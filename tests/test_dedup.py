@@ -0,0 +1,79 @@
+import random
+
+import archritique
+from archritique import ArchCritique, NearDuplicateIndex
+from bench_archritique import generate_document
+
+
+def _edit(text, rng, words=3):
+    tokens = text.split(' ')
+    for _ in range(words):
+        tokens[rng.randrange(len(tokens))] = 'revised'
+    return ' '.join(tokens)
+
+
+def test_numpy_and_python_signatures_agree():
+    index = NearDuplicateIndex()
+    text = generate_document(ArchCritique(), 300, seed=1)
+    expected = index.signature(text)
+    saved, archritique.np = archritique.np, None
+    try:
+        assert index.signature(text) == expected
+    finally:
+        archritique.np = saved
+
+
+def test_edited_documents_are_found_and_unrelated_ones_are_not():
+    critic = ArchCritique()
+    index = NearDuplicateIndex()
+    rng = random.Random(4)
+    documents = [generate_document(critic, 400, seed=seed) for seed in range(40)]
+    for position, document in enumerate(documents):
+        index.add(f'doc{position}', document)
+    for position, document in enumerate(documents):
+        matches = index.query(_edit(document, rng))
+        assert matches and matches[0][0] == f'doc{position}'
+    unrelated = generate_document(critic, 400, seed=999)
+    assert index.query(unrelated) == []
+
+
+def test_reuse_policy_returns_the_stored_analysis():
+    base = generate_document(ArchCritique(), 400, seed=2)
+    edited = _edit(base, random.Random(1))
+    critic = ArchCritique(near_duplicates=NearDuplicateIndex(), duplicate_policy='reuse')
+    first = critic.evaluate(base)
+    second = critic.evaluate(edited)
+    assert first.duplicate_of is None
+    assert second.duplicate_of is not None
+    assert second.score == first.score
+    assert second.analysis == first.analysis
+
+    flagging = ArchCritique(near_duplicates=NearDuplicateIndex())
+    flagging.evaluate(base)
+    flagged = flagging.evaluate(edited)
+    assert flagged.duplicate_of is not None
+    assert flagged.analysis == ArchCritique().analyze_input_text(edited)
+
+
+def test_pooled_runs_deduplicate_in_the_callers_index():
+    critic = ArchCritique(near_duplicates=NearDuplicateIndex(), duplicate_policy='reuse')
+    rng = random.Random(5)
+    originals = [generate_document(critic, 300, seed=seed) for seed in range(4)]
+    texts = originals + [_edit(text, rng) for text in originals]
+    scores = list(critic.score_many(texts, workers=2, chunksize=2))
+    assert len(critic.near_duplicates) == len(originals)
+    assert scores[len(originals):] == scores[:len(originals)]
+    reports = list(critic.critique_many(texts[:2], workers=2, chunksize=1))
+    assert len(reports) == 2 and len(critic.near_duplicates) == len(originals)
+
+
+def test_concurrent_near_duplicates_claim_one_entry():
+    from concurrent.futures import ThreadPoolExecutor
+    critic = ArchCritique(near_duplicates=NearDuplicateIndex())
+    text = generate_document(critic, 300, seed=2)
+    rng = random.Random(6)
+    variants = [_edit(text, rng, words=1) for _ in range(16)]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(critic.evaluate, variants))
+    assert len(critic.near_duplicates) == 1
+    assert sum(1 for result in results if result.duplicate_of is None) == 1
@@ -0,0 +1,125 @@
+"""Differential checks against the reference implementation in baseline_archritique."""
+import io
+import random
+
+import pytest
+
+import archritique
+import baseline_archritique
+
+WORDS = (
+    'green solar eco sustainable renewable efficient leed carbon energy function purpose use practical workflow '
+    'circulation program beautiful elegant stunning artistic visual proportions harmony innovative unique creative '
+    'novel cutting-edge experimental site location context surroundings neighborhood culture history accessible '
+    'universal inclusive barrier-free ada mobility cost budget affordable value economic roi clean minimal geometric '
+    'glass steel concrete bauhaus eclectic playful raw massive fragmented angular columns symmetry proportion order '
+    'traditional local cultural regional contextual excellent poor ugly failed concept philosophy theory principle '
+    'ideology vision paradigm fenestration cantilever facade atrium curtain wall thermal bridge load-bearing hvac '
+    'zoning programming massing articulation daylighting ventilation the a of and with building design space '
+    'curtain walls thermal bridges ecoeco leedleed raw.concrete xcurtain Green SOLAR Eco-friendly economics '
+    'greenery used users curtainwall principles conceptual reuse'
+).split()
+SEPARATORS = [' ', ' ', ' ', ' ', '  ', '\n', '\n\n', '. ', '! ', '? ', '... ', '\t', ', ', '.', ' .']
+EDGE_CASES = ['', ' ', '.', 'curtain wall', 'curtain  wall', 'thermal bridge thermal bridge. eco', 'a',
+              'İstanbul ΑΣ green', 'x.curtain walls', 'Σ raw concrete concrete green eco']
+
+
+def _document(rng, words):
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(WORDS))
+        parts.append(rng.choice(SEPARATORS))
+    text = ''.join(parts)
+    if rng.random() < 0.3:
+        text = '  \n' + text
+    return text
+
+
+def _corpus(seed=0, count=150):
+    rng = random.Random(seed)
+    return EDGE_CASES + [_document(rng, rng.choice([1, 3, 8, 20, 49, 60, 200, 800])) for _ in range(count)]
+
+
+@pytest.fixture(scope='module')
+def reference():
+    return baseline_archritique.ArchCritique()
+
+
+@pytest.fixture(scope='module')
+def critic():
+    return archritique.ArchCritique()
+
+
+def _expected(reference, text):
+    analysis = reference.analyze_input_text(text)
+    return analysis, reference.generate_critique_score(analysis)
+
+
+def _same(expected, analysis):
+    return {key: value for key, value in analysis.items() if key in expected} == expected
+
+
+def test_lexicon_matches_reference(reference, critic):
+    shared = [name for name in archritique.LEXICON_FIELDS if hasattr(reference, name)]
+    assert shared
+    for name in shared:
+        assert archritique._thaw(getattr(critic, name)) == getattr(reference, name)
+
+
+def test_analysis_and_score(reference, critic):
+    for text in _corpus():
+        expected, score = _expected(reference, text)
+        analysis = critic.analyze_input_text(text)
+        assert _same(expected, analysis), text
+        assert critic.generate_critique_score(analysis) == score
+        assert critic.score(text) == score
+        assert critic.evaluate(text).score == score
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 4096])
+def test_analyze_stream(reference, critic, chunk_size):
+    for text in _corpus(seed=1, count=40):
+        expected, _ = _expected(reference, text)
+        assert _same(expected, critic.analyze_stream(io.StringIO(text), chunk_size))
+        assert _same(expected, critic.analyze_stream(io.BytesIO(text.encode('utf-8')), chunk_size))
+
+
+def test_incremental_analyzer(reference, critic):
+    rng = random.Random(5)
+    incremental = archritique.IncrementalAnalyzer(critic)
+    paragraphs = [_document(rng, rng.randint(0, 40)) for _ in range(12)]
+    for _ in range(120):
+        paragraphs[rng.randrange(len(paragraphs))] = _document(rng, rng.randint(0, 40))
+        text = rng.choice(['\n\n', '\n \n', '\n\n\n  ', '\n']).join(paragraphs)
+        expected, score = _expected(reference, text)
+        assert _same(expected, incremental.analyze(text))
+        assert incremental.score(text) == score
+    assert incremental.reused > 0
+
+
+def test_analyze_parallel(reference, critic):
+    rng = random.Random(9)
+    text = ''.join(_document(rng, 400) for _ in range(10))
+    expected, _ = _expected(reference, text)
+    assert _same(expected, critic.analyze_parallel(text, workers=2, min_segment=500))
+
+
+def test_score_batch(reference, critic):
+    pytest.importorskip('numpy')
+    analyses = [reference.analyze_input_text(text) for text in _corpus(seed=2, count=80)]
+    principle_scores, complexity, depth, styles = critic.feature_arrays(analyses)
+    scores = critic.score_batch(principle_scores, complexity, depth, styles)
+    assert list(scores) == [reference.generate_critique_score(analysis) for analysis in analyses]
+
+
+def test_weight_sweep(critic):
+    pytest.importorskip('numpy')
+    analyses = [critic.analyze_input_text(text) for text in _corpus(seed=3, count=40)]
+    configurations = critic.weight_grid({'sustainability': [0.1, 0.25, 0.4], 'aesthetics': [0.05, 0.3]})
+    sweep = critic.weight_sweep(analyses, configurations)
+    for row, configuration in enumerate(configurations):
+        reference = baseline_archritique.ArchCritique()
+        for name, weight in configuration.items():
+            reference.principles[name]['weight'] = weight
+        expected = [reference.generate_critique_score(analysis) for analysis in analyses]
+        assert list(sweep['scores'][row]) == expected
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from archritique import SAMPLE_TEXT, ArchCritique, Lexicon
+
+
+def _write(tmp_path, document):
+    path = tmp_path / 'lexicon.json'
+    path.write_text(json.dumps(document), encoding='utf-8')
+    return str(path)
+
+
+def test_custom_principle_gets_a_generic_recommendation(tmp_path):
+    path = _write(tmp_path, {'extend': {'principles': {
+        'acoustics': {'weight': 0.2, 'keywords': ['reverberation'], 'description': 'Sound'}}}})
+    critic = ArchCritique()
+    critic.load_lexicon(path)
+    report = critic.critique(SAMPLE_TEXT)
+    assert 'ACOUSTICS' in report
+
+
+def test_extended_lexicon_keeps_default_analysis(tmp_path):
+    path = _write(tmp_path, {'extend': {'tech_terms': ['mass timber']}})
+    critic = ArchCritique()
+    baseline = critic.analyze_input_text(SAMPLE_TEXT)
+    critic.load_lexicon(path)
+    assert critic.analyze_input_text(SAMPLE_TEXT)['principle_scores'] == baseline['principle_scores']
+
+
+@pytest.mark.parametrize('document', [
+    {'critique_templates': {'positive': ['{aspect} IS GOOD'], 'negative': ['{aspect} IS WEAK']}},
+    {'critique_templates': {'positive': ['{aspect}'], 'negative': ['{aspect}'], 'neutral': ['{unknown}']}},
+    {'principles': {'light': {'weight': 1.0, 'keywords': 'abc', 'description': 'Light'}}},
+    {'extend': {'principles': {'sustainability': {'keywords': 'abc'}}}},
+    {'extend': {'tech_terms': 'bim'}},
+    {'tech_terms': [1, 2]},
+    {'jargon': {}},
+])
+def test_malformed_lexicon_is_rejected(tmp_path, document):
+    with pytest.raises(ValueError):
+        Lexicon.from_file(_write(tmp_path, document))
@@ -0,0 +1,63 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from archritique import ArchCritique, LexiconMissing, _map_segment, _split_sentences
+from bench_archritique import generate_document
+
+
+@pytest.fixture(scope='module')
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def _high_vocabulary_document(critic, words, seed):
+    rng = random.Random(seed)
+    base = generate_document(critic, words, density=0.3, seed=seed).split(' ')
+    out = []
+    for position, word in enumerate(base):
+        if position % 3 == 0:
+            word = ''.join(rng.choice('abcdefghij') for _ in range(rng.randint(2, 6)))
+            if position % 7 == 0:
+                word = word.capitalize()
+        out.append(word)
+    return ' '.join(out)
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_parallel_matches_serial(pool, seed):
+    critic = ArchCritique()
+    text = _high_vocabulary_document(critic, 3000, seed)
+    if seed % 3 == 1:
+        text = text.replace('.', ' ')
+    if seed % 3 == 2:
+        text = '  \n' + text + ' trailing words without a stop  '
+    serial = critic.analyze_input_text(text)
+    for min_segment in (1, 200, 5000):
+        assert critic.analyze_parallel(text, workers=4, min_segment=min_segment, executor=pool) == serial
+
+
+def test_phrases_across_cuts_with_custom_lexicon():
+    critic = ArchCritique()
+    critic.lexicon = critic.lexicon.replace(
+        tech_terms=list(critic.tech_terms) + ['green roof system', 'clean lines and geometric'])
+    text = ('Clean lines and geometric forms. Green roof. system green roof system clean lines and '
+            'geometric. ') * 400
+    serial = critic.analyze_input_text(text)
+    assert critic.analyze_parallel(text, workers=2, min_segment=100) == serial
+
+
+def test_split_keeps_text_and_cuts_after_sentences():
+    text = 'One two three. Four five six! Seven eight? Nine ten. ' * 50
+    segments = _split_sentences(text, 8, 1)
+    assert ''.join(segments) == text
+    assert len(segments) > 1
+    for segment in segments[:-1]:
+        assert segment.rstrip()[-1] in '.!?'
+
+
+def test_segment_asks_for_unknown_lexicon():
+    with pytest.raises(LexiconMissing):
+        _map_segment('some text', 'not-a-digest', 2)
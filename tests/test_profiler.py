@@ -0,0 +1,52 @@
+from archritique import SAMPLE_TEXT, ArchCritique, MicroBatcher, Profiler
+
+
+def test_score_with_profiler_matches_plain_score():
+    profiler = Profiler()
+    critic = ArchCritique(profiler=profiler)
+    assert critic.score(SAMPLE_TEXT) == ArchCritique().score(SAMPLE_TEXT)
+    assert profiler.stats()['score']['calls'] == 1
+
+
+def test_drain_and_merge_carry_totals():
+    worker = Profiler()
+    worker.record('analysis', 0.002, 10)
+    worker.record('analysis', 0.004, 30)
+    parent = Profiler()
+    parent.record('analysis', 0.001, 5)
+    parent.merge(worker.drain())
+    assert worker.stats() == {}
+    stats = parent.stats()['analysis']
+    assert stats['calls'] == 3
+    assert stats['input_size'] == 45
+    assert stats['max_input_size'] == 30
+
+
+def test_process_pool_stages_reach_parent_profiler():
+    profiler = Profiler()
+    critic = ArchCritique(profiler=profiler)
+    reports = list(critic.critique_many([SAMPLE_TEXT] * 6, workers=2, chunksize=2))
+    assert len(reports) == 6
+    assert profiler.stats()['critique']['calls'] == 6
+
+
+def test_micro_batcher_workers_report_stages():
+    profiler = Profiler()
+    batcher = MicroBatcher(ArchCritique(profiler=profiler), workers=1, max_delay=0.001)
+    try:
+        futures = [batcher.submit({'text': SAMPLE_TEXT, 'mode': mode}) for mode in ('score', 'analysis')]
+        assert 'score' in futures[0].result(timeout=30)
+        assert 'analysis' in futures[1].result(timeout=30)
+    finally:
+        batcher.close()
+    assert profiler.stats()['score']['calls'] == 2
+
+
+def test_in_process_batcher_does_not_double_count():
+    profiler = Profiler()
+    batcher = MicroBatcher(ArchCritique(profiler=profiler), workers=0, max_delay=0.001)
+    try:
+        batcher.submit({'text': SAMPLE_TEXT, 'mode': 'score'}).result(timeout=30)
+    finally:
+        batcher.close()
+    assert profiler.stats()['score']['calls'] == 1
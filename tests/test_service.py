@@ -0,0 +1,99 @@
+import os
+import pickle
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import archritique
+from archritique import SAMPLE_TEXT, ArchCritique, LexiconMissing, MicroBatcher
+
+
+def _custom_lexicon(critic):
+    principles = {name: dict(data, keywords=list(data['keywords']) + [f'zq{name}']) for name, data
+                  in critic.principles.items()}
+    return critic.lexicon.replace(principles=principles)
+
+
+def test_lexicon_digest_survives_pickling():
+    lexicon = _custom_lexicon(ArchCritique())
+    restored = pickle.loads(pickle.dumps(lexicon))
+    assert restored.digest == lexicon.digest
+    assert restored.fingerprint == lexicon.fingerprint
+
+
+def test_worker_asks_for_unknown_lexicon():
+    critic = ArchCritique()
+    lexicon = _custom_lexicon(critic)
+    archritique._init_worker(pickle.loads(pickle.dumps(critic)))
+    try:
+        with pytest.raises(LexiconMissing):
+            archritique._run_chunk('score', ['text'], 'not-a-digest')
+        restored = pickle.loads(pickle.dumps(lexicon))
+        archritique._run_chunk('score', ['text'], restored)
+        results, _ = archritique._run_chunk('score', [SAMPLE_TEXT + ' zqinnovation'], lexicon.digest)
+    finally:
+        archritique._init_worker(None)
+    critic.lexicon = lexicon
+    assert results == [critic.score(SAMPLE_TEXT + ' zqinnovation')]
+
+
+def test_batcher_follows_lexicon_changes():
+    critic = ArchCritique()
+    lexicon = _custom_lexicon(critic)
+    text = SAMPLE_TEXT + ' zqsustainability zqinnovation'
+    plain = critic.respond({'text': text})
+    critic.lexicon = lexicon
+    custom = critic.respond({'text': text})
+    assert custom != plain
+
+    batcher = MicroBatcher(critic, workers=1, max_delay=0.001)
+    try:
+        assert batcher.submit({'text': text}).result(timeout=30) == custom
+        assert batcher.submit({'text': text}).result(timeout=30) == custom
+        critic.lexicon = archritique.default_lexicon()
+        assert batcher.submit({'text': text}).result(timeout=30) == plain
+        critic.lexicon = lexicon
+        assert batcher.submit({'text': text}).result(timeout=30) == custom
+    finally:
+        batcher.close()
+
+
+@pytest.mark.parametrize('workers', [0, 1])
+def test_failing_request_does_not_fail_its_batch(workers):
+    critic = ArchCritique()
+    batcher = MicroBatcher(critic, workers=workers, max_batch=3, max_delay=0.2)
+    try:
+        good = batcher.submit({'text': SAMPLE_TEXT, 'mode': 'score'})
+        bad = batcher.submit({'mode': 'analysis'})
+        other = batcher.submit({'text': SAMPLE_TEXT, 'mode': 'analysis'})
+        assert good.result(timeout=30) == {'score': critic.score(SAMPLE_TEXT)}
+        assert other.result(timeout=30) == critic.respond({'text': SAMPLE_TEXT})
+        with pytest.raises(KeyError):
+            bad.result(timeout=30)
+    finally:
+        batcher.close()
+    assert batcher.metrics.batches == 1
+
+
+class _ExitOnLoad:
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def test_batcher_replaces_a_broken_pool():
+    critic = ArchCritique()
+    expected = {'score': critic.score(SAMPLE_TEXT)}
+    batcher = MicroBatcher(critic, workers=1, max_delay=0.001)
+    try:
+        assert batcher.submit({'text': SAMPLE_TEXT, 'mode': 'score'}).result(timeout=30) == expected
+        with pytest.raises(BrokenProcessPool):
+            batcher.submit({'text': _ExitOnLoad(), 'mode': 'score'}).result(timeout=30)
+        assert batcher.submit({'text': SAMPLE_TEXT, 'mode': 'score'}).result(timeout=30) == expected
+        for process in list(batcher._executor._processes.values()):
+            process.kill()
+            process.join()
+        time.sleep(0.2)
+        assert batcher.submit({'text': SAMPLE_TEXT, 'mode': 'score'}).result(timeout=30) == expected
+    finally:
+        batcher.close()